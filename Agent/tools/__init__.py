@@ -5,13 +5,15 @@ from .service_search_tool import ServiceSearchTool
 from .booking_search_tool import BookingSearchTool
 from .booking_creation_tool import BookingCreationTool
 from .price_comparison_tool import PriceComparisonTool
+from .tool_cache import CachedTool, ToolCache, wrap_with_cache, cache_stats
 
-# Export all tools in a dictionary for easy access
-tools = {
+# Export all tools in a dictionary for easy access, with results cached
+# per tool as configured on each tool class
+tools = wrap_with_cache({
     "faq": FAQTool(),
     "clinic_search": ClinicSearchTool(),
     "service_search": ServiceSearchTool(),
     "booking_search": BookingSearchTool(),
     "booking_creation": BookingCreationTool(),
     "price_comparison": PriceComparisonTool()
-} 
\ No newline at end of file
+}) 
\ No newline at end of file
@@ -1,7 +1,17 @@
-from typing import Dict, Any
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Sequence
 
 class Tool:
     """Base Tool class that all specific tools will inherit from."""
+
+    # Seconds a result stays cached; None disables caching for the tool
+    cache_ttl: Optional[float] = None
+    # Maximum number of cached results before least recently used are evicted
+    cache_max_size: int = 128
+    # Cached tools invalidated by a successful call, mapped to the parameters
+    # that scope the invalidation (e.g. {"booking_search": ["user_id"]}).
+    # Read-only here; subclasses rebind it rather than mutating it.
+    invalidates: Mapping[str, Sequence[str]] = MappingProxyType({})
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
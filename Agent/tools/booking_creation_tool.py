@@ -5,6 +5,9 @@ from datetime import datetime
 
 class BookingCreationTool(Tool):
     """Tool for creating new bookings."""
+
+    # A new booking makes that user's cached booking searches stale
+    invalidates = {"booking_search": ["user_id"]}
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3,6 +3,9 @@ from .base_tool import Tool
 
 class BookingSearchTool(Tool):
     """Tool for searching existing bookings."""
+
+    cache_ttl = 60
+    cache_max_size = 256
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
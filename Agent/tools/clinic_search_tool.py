@@ -3,6 +3,8 @@ from .base_tool import Tool
 
 class ClinicSearchTool(Tool):
     """Tool for searching medical clinics."""
+
+    cache_ttl = 600
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3,6 +3,8 @@ from .base_tool import Tool
 
 class FAQTool(Tool):
     """Tool for answering frequently asked questions."""
+
+    cache_ttl = 3600
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -3,6 +3,8 @@ from .base_tool import Tool
 
 class PriceComparisonTool(Tool):
     """Tool for comparing prices of medical services across clinics."""
+
+    cache_ttl = 900
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
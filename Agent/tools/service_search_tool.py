@@ -3,6 +3,8 @@ from .base_tool import Tool
 
 class ServiceSearchTool(Tool):
     """Tool for searching medical services."""
+
+    cache_ttl = 3600
     
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -0,0 +1,259 @@
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from .base_tool import Tool
+
+# Distinguishes "no override given" from an explicit None (caching disabled)
+_UNSET = object()
+
+
+def normalize_params(params: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Normalize tool parameters so equivalent calls share a cache entry.
+
+    Tools read parameters with ``params.get(name, "")``, so missing, ``None``
+    and empty values are equivalent and are dropped. String values are
+    stripped of surrounding whitespace.
+    """
+    normalized = {}
+    for name, value in (params or {}).items():
+        if isinstance(value, str):
+            value = value.strip()
+        if value is None or value == "":
+            continue
+        normalized[name] = value
+    return normalized
+
+
+def scope_value(value: Any) -> str:
+    """
+    Normalize a value used to scope invalidation.
+
+    Parameters come from LLM-generated JSON, so the same user may appear as
+    ``42`` or ``" 42"``; both compare equal once normalized.
+    """
+    return str(value).strip()
+
+
+def make_cache_key(params: Dict[str, Any]) -> str:
+    """Build a stable cache key from normalized parameters."""
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+class ToolCache:
+    """LRU cache with a per-entry TTL and hit/miss counters."""
+
+    def __init__(self, ttl: float, max_size: int = 128, clock: Callable[[], float] = time.monotonic):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any], Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        # Bumped on every invalidation so in-flight results can detect that
+        # they may be stale before being stored
+        self.generation = 0
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached result for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, _, result = entry
+            if self._clock() >= expires_at:
+                del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return copy.deepcopy(result)
+
+    def set(self, key: str, params: Dict[str, Any], result: Dict[str, Any],
+            generation: Optional[int] = None) -> bool:
+        """
+        Store a result, evicting the least recently used entry when full.
+
+        If generation is given and an invalidation has happened since it was
+        read, the result may be stale and is not stored.
+
+        Returns:
+            True if the result was stored
+        """
+        if self.max_size <= 0:
+            return False
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self._entries[key] = (self._clock() + self.ttl, params, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def invalidate(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """
+        Remove every entry whose normalized parameters satisfy predicate.
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            self.generation += 1
+            stale = [key for key, (_, params, _) in self._entries.items() if predicate(params)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+            return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+class CachedTool(Tool):
+    """
+    Wraps a tool so its results are cached and its writes invalidate
+    results cached by other tools.
+
+    Caching is configured by the wrapped tool's ``cache_ttl`` and
+    ``cache_max_size`` attributes; a ``cache_ttl`` of None disables it.
+    Invalidation follows the wrapped tool's ``invalidates`` mapping.
+    """
+
+    def __init__(self, name: str, tool: Tool, registry: Dict[str, Tool],
+                 ttl: Any = _UNSET, max_size: Any = _UNSET):
+        self.name = name
+        self.tool = tool
+        self.registry = registry
+        ttl = tool.cache_ttl if ttl is _UNSET else ttl
+        max_size = tool.cache_max_size if max_size is _UNSET else max_size
+        self.cache = ToolCache(ttl, max_size) if ttl is not None else None
+
+    def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Execute the wrapped tool, serving repeated calls from the cache.
+
+        Args:
+            params: Dictionary of parameters for the tool
+
+        Returns:
+            Dictionary containing the results of the tool execution
+        """
+        normalized = normalize_params(params)
+
+        if self.cache is None:
+            result = self.tool.execute(params)
+        else:
+            # The tool sees the same normalized parameters the cache is keyed
+            # on, so equivalent calls really do produce identical results
+            key = make_cache_key(normalized)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+            generation = self.cache.generation
+            result = self.tool.execute(normalized)
+            if result.get("status") != "error":
+                self.cache.set(key, normalized, result, generation=generation)
+
+        if result.get("status") != "error":
+            self._invalidate_dependents(normalized)
+        return result
+
+    def invalidate(self, match: Dict[str, Any]) -> int:
+        """
+        Remove cached results whose parameters equal every value in match.
+
+        Values are compared after scope_value normalization on both sides.
+        Results cached without one of the fields covered every value of it
+        (e.g. a booking search without ``user_id``), so they are removed too.
+
+        Returns:
+            Number of cached results removed
+        """
+        if self.cache is None:
+            return 0
+        match = {name: scope_value(value) for name, value in match.items()}
+        return self.cache.invalidate(
+            lambda cached: all(
+                name not in cached or scope_value(cached[name]) == value
+                for name, value in match.items()
+            )
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        if self.cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self.cache.stats()}
+
+    def _invalidate_dependents(self, params: Dict[str, Any]) -> None:
+        for target, fields in self.tool.invalidates.items():
+            dependent = self.registry.get(target)
+            if not isinstance(dependent, CachedTool):
+                continue
+            match = {field: params.get(field) for field in fields}
+            # Without the scoping values we cannot tell which entries are stale
+            if any(value is None for value in match.values()):
+                continue
+            dependent.invalidate(match)
+
+
+def wrap_with_cache(tools: Dict[str, Tool],
+                    config: Optional[Dict[str, Dict[str, Any]]] = None) -> Dict[str, Tool]:
+    """
+    Wrap every tool in a CachedTool sharing a single registry.
+
+    Tools that are already wrapped are unwrapped first, so re-wrapping a
+    registry rebuilds its caches instead of nesting them.
+
+    Args:
+        tools: Mapping of tool name to tool instance
+        config: Optional per-tool overrides, e.g. {"clinic_search": {"ttl": 60, "max_size": 32}};
+            {"ttl": None} disables caching for that tool
+
+    Returns:
+        Mapping of tool name to cached tool
+    """
+    config = config or {}
+    registry: Dict[str, Tool] = {}
+    for name, tool in tools.items():
+        if isinstance(tool, CachedTool):
+            tool = tool.tool
+        overrides = config.get(name, {})
+        registry[name] = CachedTool(
+            name,
+            tool,
+            registry,
+            ttl=overrides.get("ttl", _UNSET),
+            max_size=overrides.get("max_size", _UNSET),
+        )
+    return registry
+
+
+def cache_stats(tools: Dict[str, Tool]) -> Dict[str, Dict[str, Any]]:
+    """Return hit/miss statistics for each cached tool."""
+    return {name: tool.stats() for name, tool in tools.items() if isinstance(tool, CachedTool)}
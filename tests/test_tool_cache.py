@@ -0,0 +1,226 @@
+from Agent.tools import (
+    BookingCreationTool,
+    BookingSearchTool,
+    ClinicSearchTool,
+    Tool,
+    ToolCache,
+    cache_stats,
+    wrap_with_cache,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_tools(config=None):
+    return wrap_with_cache({
+        "clinic_search": ClinicSearchTool(),
+        "booking_search": BookingSearchTool(),
+        "booking_creation": BookingCreationTool(),
+    }, config)
+
+
+def book(tools, user_id):
+    return tools["booking_creation"].execute({
+        "user_id": user_id,
+        "service": "Dental Cleaning",
+        "date": "2023-08-01",
+        "time": "9:00 AM",
+        "clinic_id": "clinic-1",
+    })
+
+
+def test_identical_and_equivalent_params_hit():
+    tools = make_tools()
+    clinic_search = tools["clinic_search"]
+
+    first = clinic_search.execute({"location": "Boston", "specialty": ""})
+    assert clinic_search.execute({"location": "Boston"}) == first
+    assert clinic_search.execute({"location": "  Boston ", "specialty": None}) == first
+    clinic_search.execute({"location": "Denver"})
+
+    stats = clinic_search.stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+
+
+def test_cached_result_matches_key():
+    tools = make_tools()
+    clinic_search = tools["clinic_search"]
+
+    clinic_search.execute({"location": "  Boston "})
+    result = clinic_search.execute({"location": "Boston"})
+
+    assert result["clinics"][0]["location"] == "Boston"
+
+
+def test_cached_results_are_copies():
+    tools = make_tools()
+    clinic_search = tools["clinic_search"]
+
+    clinic_search.execute({"location": "Boston"})["clinics"].clear()
+
+    assert clinic_search.execute({"location": "Boston"})["clinics"]
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ToolCache(ttl=10, max_size=4, clock=clock)
+    cache.set("a", {}, {"value": 1})
+
+    clock.now = 9.9
+    assert cache.get("a") == {"value": 1}
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_lru_eviction_order():
+    cache = ToolCache(ttl=10, max_size=2, clock=FakeClock())
+    cache.set("a", {}, {"value": 1})
+    cache.set("b", {}, {"value": 2})
+    cache.get("a")
+    cache.set("c", {}, {"value": 3})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("c") == {"value": 3}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_set_skipped_after_concurrent_invalidation():
+    cache = ToolCache(ttl=10, max_size=4, clock=FakeClock())
+    generation = cache.generation
+    cache.invalidate(lambda params: True)
+
+    assert not cache.set("a", {}, {"value": 1}, generation=generation)
+    assert cache.get("a") is None
+
+
+def test_booking_creation_invalidates_only_that_users_searches():
+    tools = make_tools()
+    tools["booking_search"].execute({"user_id": "alice"})
+    tools["booking_search"].execute({"user_id": "alice", "date_from": "2023-01-01"})
+    tools["booking_search"].execute({"user_id": "bob"})
+    tools["clinic_search"].execute({"location": "Boston"})
+
+    book(tools, "alice")
+
+    stats = cache_stats(tools)
+    assert stats["booking_search"]["invalidations"] == 2
+    assert stats["booking_search"]["size"] == 1
+    assert stats["clinic_search"]["size"] == 1
+    assert stats["clinic_search"]["invalidations"] == 0
+
+    tools["booking_search"].execute({"user_id": "bob"})
+    assert tools["booking_search"].stats()["hits"] == 1
+
+
+def test_booking_creation_invalidates_unscoped_searches():
+    tools = make_tools()
+    tools["booking_search"].execute({})
+    tools["booking_search"].execute({"user_id": "alice"})
+    tools["booking_search"].execute({"user_id": "bob"})
+
+    book(tools, "alice")
+
+    stats = tools["booking_search"].stats()
+    assert stats["invalidations"] == 2
+    assert stats["size"] == 1
+
+
+def test_invalidation_normalizes_scoping_values():
+    tools = make_tools()
+    tools["booking_search"].execute({"user_id": 42})
+
+    book(tools, " 42")
+
+    assert tools["booking_search"].stats()["invalidations"] == 1
+    assert tools["booking_search"].stats()["size"] == 0
+
+
+def test_failed_booking_does_not_invalidate():
+    tools = make_tools()
+    tools["booking_search"].execute({"user_id": "alice"})
+
+    result = tools["booking_creation"].execute({"user_id": "alice"})
+
+    assert result["status"] == "error"
+    assert tools["booking_search"].stats()["size"] == 1
+
+
+def test_search_racing_a_booking_is_not_cached():
+    tools = make_tools()
+    search = tools["booking_search"]
+    original_execute = search.tool.execute
+
+    def execute_while_booking(params):
+        result = original_execute(params)
+        book(tools, params["user_id"])
+        return result
+
+    search.tool.execute = execute_while_booking
+    search.execute({"user_id": "alice"})
+
+    assert search.stats()["size"] == 0
+
+
+def test_error_results_are_not_cached():
+    class FlakyTool(Tool):
+        cache_ttl = 60
+
+        def __init__(self):
+            self.calls = 0
+
+        def execute(self, params):
+            self.calls += 1
+            return {"status": "error", "message": "unavailable"}
+
+    flaky = FlakyTool()
+    tools = wrap_with_cache({"flaky": flaky})
+
+    tools["flaky"].execute({"query": "x"})
+    tools["flaky"].execute({"query": "x"})
+
+    assert flaky.calls == 2
+    assert tools["flaky"].stats()["size"] == 0
+
+
+def test_config_can_disable_caching():
+    tools = make_tools({"clinic_search": {"ttl": None}, "booking_search": {"max_size": 1}})
+
+    assert tools["clinic_search"].stats() == {"enabled": False}
+    assert tools["booking_search"].stats()["max_size"] == 1
+    assert tools["booking_search"].stats()["ttl"] == BookingSearchTool.cache_ttl
+
+
+def test_uncached_tools_receive_original_params():
+    class RecordingTool(Tool):
+        def execute(self, params):
+            self.params = params
+            return {"status": "success"}
+
+    recording = RecordingTool()
+    tools = wrap_with_cache({"recording": recording})
+    params = {"user_id": " alice ", "note": ""}
+
+    tools["recording"].execute(params)
+
+    assert recording.params == params
+
+
+def test_rewrapping_keeps_caching_and_invalidation():
+    tools = wrap_with_cache(make_tools())
+    tools["booking_search"].execute({"user_id": "alice"})
+
+    assert tools["booking_search"].stats()["enabled"]
+    assert tools["booking_search"].stats()["size"] == 1
+
+    book(tools, "alice")
+
+    assert tools["booking_search"].stats()["size"] == 0